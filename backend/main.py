@@ -1,10 +1,11 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Float, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from datetime import datetime
 import os
+import orjson
 
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*"}}, 
@@ -13,8 +14,24 @@ CORS(app, resources={r"/api/*": {"origins": "*"}},
 
 # SQLite database (creates file automatically, no setup needed)
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'safety_app.db')
+# Default QueuePool keeps connections open; scoped_session gives each request its own session
 engine = create_engine(f'sqlite:///{DATABASE_PATH}')
-Session = sessionmaker(bind=engine)
+Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+@event.listens_for(engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
+
+@app.teardown_appcontext
+def remove_session(exception=None):
+    Session.remove()
+
 Base = declarative_base()
 
 # ===== DATABASE MODELS =====
@@ -39,9 +56,9 @@ class Event(Base):
             'name': self.name,
             'type': self.event_type,
             'location': {'lat': self.latitude, 'lng': self.longitude},
-            'time': self.time.isoformat(),
+            'time': self.time,
             'notes': self.notes,
-            'timestamp': self.created_at.isoformat(),
+            'timestamp': self.created_at,
             'userLocation': {'lat': self.user_lat, 'lng': self.user_lng}
         }
 
@@ -60,7 +77,7 @@ class CrowdLocation(Base):
         return {
             'id': self.id,
             'location': {'lat': self.latitude, 'lng': self.longitude},
-            'timestamp': self.created_at.isoformat(),
+            'timestamp': self.created_at,
             'reports': self.reports,
             'userLocation': {'lat': self.user_lat, 'lng': self.user_lng}
         }
@@ -84,7 +101,7 @@ class DangerZone(Base):
             'location': {'lat': self.latitude, 'lng': self.longitude},
             'radius': self.radius,
             'dangerLevel': self.danger_level,
-            'timestamp': self.created_at.isoformat(),
+            'timestamp': self.created_at,
             'reports': self.reports,
             'userLocation': {'lat': self.user_lat, 'lng': self.user_lng}
         }
@@ -92,6 +109,54 @@ class DangerZone(Base):
 # Create all tables
 Base.metadata.create_all(engine)
 
+# ===== LIST QUERIES =====
+# SQLite builds the JSON arrays itself (same shape as to_dict), so list
+# endpoints skip ORM hydration and per-row serialization entirely
+
+EVENTS_JSON_SQL = text("""
+    SELECT json_group_array(json_object(
+        'id', id,
+        'name', name,
+        'type', event_type,
+        'location', json_object('lat', latitude, 'lng', longitude),
+        'time', replace(time, ' ', 'T'),
+        'notes', notes,
+        'timestamp', replace(created_at, ' ', 'T'),
+        'userLocation', json_object('lat', user_lat, 'lng', user_lng)
+    )) FROM events
+""")
+
+CROWDS_JSON_SQL = text("""
+    SELECT json_group_array(json_object(
+        'id', id,
+        'location', json_object('lat', latitude, 'lng', longitude),
+        'timestamp', replace(created_at, ' ', 'T'),
+        'reports', reports,
+        'userLocation', json_object('lat', user_lat, 'lng', user_lng)
+    )) FROM crowd_locations
+""")
+
+DANGERS_JSON_SQL = text("""
+    SELECT json_group_array(json_object(
+        'id', id,
+        'location', json_object('lat', latitude, 'lng', longitude),
+        'radius', radius,
+        'dangerLevel', danger_level,
+        'timestamp', replace(created_at, ' ', 'T'),
+        'reports', reports,
+        'userLocation', json_object('lat', user_lat, 'lng', user_lng)
+    )) FROM danger_zones
+""")
+
+def json_response(data, status=200):
+    # orjson writes bytes directly and formats datetimes natively
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
+def json_list_response(query):
+    session = Session()
+    body = session.execute(query).scalar()
+    return Response(body, status=200, mimetype='application/json')
+
 # ===== ROUTES =====
 
 @app.route('/api/add-event', methods=['POST'])
@@ -114,11 +179,10 @@ def add_event():
         session.add(event)
         session.commit()
         result = event.to_dict()
-        session.close()
         
-        return jsonify({'success': True, 'data': result}), 201
+        return json_response({'success': True, 'data': result}, 201)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return json_response({'success': False, 'error': str(e)}, 400)
 
 @app.route('/api/report-crowd', methods=['POST'])
 def report_crowd():
@@ -135,11 +199,10 @@ def report_crowd():
         session.add(crowd)
         session.commit()
         result = crowd.to_dict()
-        session.close()
         
-        return jsonify({'success': True, 'data': result}), 201
+        return json_response({'success': True, 'data': result}, 201)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return json_response({'success': False, 'error': str(e)}, 400)
 
 @app.route('/api/report-danger', methods=['POST'])
 def report_danger():
@@ -158,48 +221,35 @@ def report_danger():
         session.add(danger)
         session.commit()
         result = danger.to_dict()
-        session.close()
         
-        return jsonify({'success': True, 'data': result}), 201
+        return json_response({'success': True, 'data': result}, 201)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return json_response({'success': False, 'error': str(e)}, 400)
 
 @app.route('/api/events', methods=['GET'])
 def get_events():
     try:
-        session = Session()
-        events = session.query(Event).all()
-        result = [event.to_dict() for event in events]
-        session.close()
-        return jsonify(result), 200
+        return json_list_response(EVENTS_JSON_SQL)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 @app.route('/api/crowds', methods=['GET'])
 def get_crowds():
     try:
-        session = Session()
-        crowds = session.query(CrowdLocation).all()
-        result = [crowd.to_dict() for crowd in crowds]
-        session.close()
-        return jsonify(result), 200
+        return json_list_response(CROWDS_JSON_SQL)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 @app.route('/api/dangers', methods=['GET'])
 def get_dangers():
     try:
-        session = Session()
-        dangers = session.query(DangerZone).all()
-        result = [danger.to_dict() for danger in dangers]
-        session.close()
-        return jsonify(result), 200
+        return json_list_response(DANGERS_JSON_SQL)
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
 
 @app.route('/api/health', methods=['GET'])
 def health():
-    return jsonify({'status': 'Backend is running'}), 200
+    return json_response({'status': 'Backend is running'}, 200)
 
 if __name__ == '__main__':
     app.run(debug=True, port=8000)
\ No newline at end of file